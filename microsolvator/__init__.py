@@ -4,7 +4,7 @@ __version__ = "0.0.1"
 
 from .config import MicrosolvatorConfig
 from .results import MicrosolvationResult
-from .runner import Microsolvator
+from .runner import Microsolvator, read_tail
 from .support import (
     list_supported_implicit_solvents,
     supports_implicit_solvent,
@@ -22,6 +22,7 @@ __all__ = [
     "MicrosolvatorConfig",
     "MicrosolvationResult",
     "Microsolvator",
+    "read_tail",
     "list_supported_implicit_solvents",
     "supports_implicit_solvent",
     "install_crest",
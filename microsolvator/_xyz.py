@@ -0,0 +1,38 @@
+"""Minimal plain-XYZ serialization for microsolvator's own input/output files."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Union
+
+if TYPE_CHECKING:
+    from ase import Atoms
+
+
+# Same layout as ase.io.xyz.write_xyz, so files are byte-identical.
+_LINE = "%-2s %22.15f %22.15f %22.15f\n"
+
+
+def format_xyz(frames: Iterable[Atoms], comment: str = "") -> str:
+    """Return the XYZ text for *frames* as a single string."""
+
+    parts: List[str] = []
+    for atoms in frames:
+        parts.append(f"{len(atoms)}\n{comment}\n")
+        parts.extend(
+            _LINE % (symbol, x, y, z)
+            for symbol, (x, y, z) in zip(atoms.get_chemical_symbols(), atoms.positions.tolist())
+        )
+    return "".join(parts)
+
+
+def write_xyz(
+    path: Union[str, "os.PathLike[str]"],
+    atoms: Union[Atoms, Sequence[Atoms]],
+    comment: str = "",
+) -> None:
+    """Write one structure or a list of frames to *path* in a single write."""
+
+    frames = atoms if isinstance(atoms, (list, tuple)) else [atoms]
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as handle:
+        handle.write(format_xyz(frames, comment))
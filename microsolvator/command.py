@@ -2,44 +2,78 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 from shutil import which
 
 from .config import MicrosolvatorConfig
 
 
+StrPath = Union[str, "os.PathLike[str]"]
+
+
 def build_crest_command(
     *,
     config: MicrosolvatorConfig,
     crest_executable: str,
     xtb_executable: str,
-    solute_path: Path,
-    solvent_path: Path,
+    solute_path: StrPath,
+    solvent_path: StrPath,
 ) -> List[str]:
     """Return the full CREST command as a list suitable for subprocess calls."""
 
-    command: List[str] = [
+    flags = config.build_flag_list()
+    qcg = flags.index("--qcg") + 1
+    return [
         _normalize_exec_path(crest_executable),
-        str(solute_path.resolve()),
+        _fast_abs(solute_path),
+        *flags[:qcg],
+        _fast_abs(solvent_path),
+        *flags[qcg:],
+        "--xnam",
+        _normalize_exec_path(xtb_executable),
     ]
-    for flag in config.build_flag_list():
-        command.append(flag)
-        if flag == "--qcg":
-            command.append(str(solvent_path.resolve()))
-    command.extend(["--xnam", _normalize_exec_path(xtb_executable)])
-    return command
 
 
 def _normalize_exec_path(executable: str) -> str:
-    path = Path(executable).expanduser()
-    if path.is_absolute():
-        return str(path.resolve())
-    string_path = str(path)
-    if os.sep in string_path or (os.altsep and os.altsep in string_path):
-        return str(path.resolve())
-    resolved = which(executable)
+    if not executable.startswith("~") and not _has_separator(executable):
+        return _which_normalized(executable)
+
+    expanded = os.path.expanduser(executable)
+    if os.path.isabs(expanded) or _has_separator(expanded):
+        return _fast_abs(expanded)
+    return _which_normalized(expanded)
+
+
+def _fast_abs(path: StrPath) -> str:
+    """Return an absolute path string, resolving only when a symlink is involved.
+
+    Paths built by the runner are already absolute and symlink-free, so the
+    common case is a pure string operation.
+    """
+
+    path_str = os.fspath(path)
+    if not os.path.isabs(path_str):
+        return os.path.realpath(path_str)
+    if not os.path.islink(path_str):
+        return os.path.normpath(path_str)
+    return os.path.realpath(path_str)
+
+
+def _has_separator(path: str) -> bool:
+    return os.sep in path or bool(os.altsep and os.altsep in path)
+
+
+def _which_normalized(executable: str) -> str:
+    resolved = _which_cached(executable, os.environ.get("PATH", ""))
     if resolved:
-        return str(Path(resolved).resolve())
+        return os.path.realpath(resolved)
     return executable
+
+
+@functools.lru_cache(maxsize=128)
+def _which_cached(name: str, path_env: str) -> Optional[str]:
+    """Look up *name* on ``PATH``; *path_env* keys the cache on its value."""
+
+    return which(name, path=path_env or None)
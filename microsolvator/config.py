@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 
 @dataclass
@@ -25,39 +26,35 @@ class MicrosolvatorConfig:
     nopreopt: bool = False
     additional_flags: Sequence[str] = field(default_factory=tuple)
 
-    def build_flag_list(self) -> List[str]:
-        """Return a mutable list of CREST CLI flags without solute/solvent files."""
-
-        flags: List[str] = ["--qcg"]
-        if self.nsolv <= 0:
-            raise ValueError("nsolv must be a positive integer")
-        flags.extend(["--nsolv", str(self.nsolv)])
-
-        flags.extend(["--temp", "%g" % self.temperature])
-        if self.threads <= 0:
-            raise ValueError("threads must be a positive integer")
-        flags.extend(["--T", str(self.threads)])
-        flags.extend(["--mdtime", str(self.mdtime)])
-
-        flags.extend(["--enslvl", _method_flag(self.method)])
-
-        if self.ensemble:
-            flags.append("--ensemble")
-
+    def __post_init__(self) -> None:
         if self.implicit_model and self.implicit_solvent:
-            flags.extend([f"--{self.implicit_model}", self.implicit_solvent])
-        elif self.implicit_model or self.implicit_solvent:
-            raise ValueError("Both implicit_model and implicit_solvent must be provided together")
-
-        flags.extend(["--chrg", str(self.charge)])
-        flags.extend(["--uhf", str(self.uhf)])
+            from .support import validate_implicit_choice
 
-        flags.extend(self.additional_flags)
+            validate_implicit_choice(
+                method=self.method,
+                model=self.implicit_model,
+                solvent=self.implicit_solvent,
+            )
 
-        if self.nopreopt:
-            flags.append("--nopreopt")
+    def build_flag_list(self) -> List[str]:
+        """Return a mutable list of CREST CLI flags without solute/solvent files."""
 
-        return flags
+        return list(
+            _build_flags(
+                self.nsolv,
+                self.method,
+                self.temperature,
+                self.mdtime,
+                self.threads,
+                self.charge,
+                self.uhf,
+                self.implicit_model,
+                self.implicit_solvent,
+                self.ensemble,
+                self.nopreopt,
+                tuple(self.additional_flags),
+            )
+        )
 
     @classmethod
     def from_kwargs(cls, **kwargs: object) -> "MicrosolvatorConfig":
@@ -66,16 +63,70 @@ class MicrosolvatorConfig:
         return cls(**kwargs)  # type: ignore[arg-type]
 
 
+@functools.lru_cache(maxsize=128, typed=True)
+def _build_flags(
+    nsolv: int,
+    method: str,
+    temperature: float,
+    mdtime: float,
+    threads: int,
+    charge: int,
+    uhf: int,
+    implicit_model: Optional[str],
+    implicit_solvent: Optional[str],
+    ensemble: bool,
+    nopreopt: bool,
+    additional_flags: Tuple[str, ...],
+) -> Tuple[str, ...]:
+    """Build the flag sequence for one set of config values.
+
+    Results are cached as tuples so batch runs sharing a configuration reuse
+    them; ``typed=True`` keeps e.g. ``mdtime=50`` and ``mdtime=50.0`` apart
+    since they render differently.
+    """
+
+    if nsolv <= 0:
+        raise ValueError("nsolv must be a positive integer")
+    if threads <= 0:
+        raise ValueError("threads must be a positive integer")
+    if bool(implicit_model) != bool(implicit_solvent):
+        raise ValueError("Both implicit_model and implicit_solvent must be provided together")
+
+    implicit: Tuple[str, ...] = ()
+    if implicit_model and implicit_solvent:
+        implicit = (f"--{implicit_model}", implicit_solvent)
+
+    return (
+        "--qcg",
+        "--nsolv", str(nsolv),
+        "--temp", "%g" % temperature,
+        "--T", str(threads),
+        "--mdtime", str(mdtime),
+        "--enslvl", _method_flag(method),
+        *(("--ensemble",) if ensemble else ()),
+        *implicit,
+        "--chrg", str(charge),
+        "--uhf", str(uhf),
+        *additional_flags,
+        *(("--nopreopt",) if nopreopt else ()),
+    )
+
+
+_METHOD_MAP: Dict[str, str] = {
+    "gfn2": "gfn2",
+    "gfn-2": "gfn2",
+    "gfn1": "gfn1",
+    "gfn-1": "gfn1",
+    "gfn0": "gfn0",
+    "gfn-0": "gfn0",
+    "gfnff": "gfnff",
+    "gfn-ff": "gfnff",
+    "ff": "gfnff",
+}
+
+
 def _method_flag(method: str) -> str:
-    name = method.strip().lower()
-
-    if name in {"gfn2", "gfn-2"}:
-        return "gfn2"
-    if name in {"gfn1", "gfn-1"}:
-        return "gfn1"
-    if name in {"gfn0", "gfn-0"}:
-        return "gfn0"
-    if name in {"gfnff", "gfn-ff", "ff"}:
-        return "gfnff"
-
-    raise ValueError(f"Unsupported method '{method}' for CREST run")
+    try:
+        return _METHOD_MAP[method.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported method '{method}' for CREST run") from None
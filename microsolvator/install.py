@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import stat
@@ -85,36 +86,121 @@ def _resolve_binary(*, explicit_path: Optional[str], env_var: str, binary_name:
             raise FileNotFoundError(f"Specified {binary_name} executable not found: {explicit}")
         return str(explicit.resolve())
 
-    env_path = os.environ.get(env_var)
-    if env_path:
-        env_candidate = Path(env_path).expanduser()
+    env_value = os.environ.get(env_var)
+    if env_value:
+        env_candidate = Path(env_value).expanduser()
         if not env_candidate.exists():
             raise FileNotFoundError(
                 f"Environment variable {env_var} points to missing {binary_name}: {env_candidate}"
             )
         return str(env_candidate.resolve())
 
+    try:
+        bin_mtime = PACKAGE_BIN_DIR.stat().st_mtime_ns
+    except OSError:
+        bin_mtime = 0
+
+    located = _locate_binary_cached(
+        binary_name,
+        os.environ.get("PATH"),
+        str(PACKAGE_BIN_DIR),
+        bin_mtime,
+    )
+    if located is None:
+        return binary_name
+    return os.path.realpath(located)
+
+
+@functools.lru_cache(maxsize=32)
+def _locate_binary_cached(
+    binary_name: str,
+    path_env: Optional[str],
+    bin_dir: str,
+    bin_mtime: int,
+) -> Optional[str]:
+    """Search the package bin directory and ``PATH`` once per lookup state.
+
+    The cache key holds ``PATH`` and the package bin directory together
+    with its modification time, so installing a new binary invalidates the
+    cached answer.  Explicit and environment-variable paths are checked by
+    the caller on every call, and symlinks are resolved fresh each time.
+    """
+
     package_candidate = _find_in_package(binary_name)
     if package_candidate is not None:
-        return str(package_candidate.resolve())
-
-    located = which(binary_name)
-    if located:
-        return str(Path(located).resolve())
+        return str(package_candidate)
 
-    return binary_name
+    return which(binary_name, path=path_env)
 
 
 def _find_in_package(binary_name: str) -> Optional[Path]:
     if not PACKAGE_BIN_DIR.exists():
         return None
 
-    for candidate in PACKAGE_BIN_DIR.rglob(binary_name):
-        if candidate.is_file() and os.access(candidate, os.X_OK):
-            return candidate
+    # install_crest/install_xtb place binaries directly in the bin directory,
+    # so a single directory listing settles the common case.
+    top_level = _scan_top_level(PACKAGE_BIN_DIR, binary_name)
+    if top_level is not None:
+        return top_level
+
+    cache_path = PACKAGE_BIN_DIR / f".resolved_{binary_name}"
+    cached = _read_resolved_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    candidate = _scan_for(PACKAGE_BIN_DIR, binary_name, executable=True)
+    if candidate is not None:
+        _write_resolved_cache(cache_path, candidate)
+    return candidate
+
+
+def _scan_top_level(root: Path, binary_name: str) -> Optional[Path]:
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if (
+                    entry.name == binary_name
+                    and entry.is_file()
+                    and os.access(entry.path, os.X_OK)
+                ):
+                    return Path(entry.path)
+    except OSError:
+        pass
+    return None
+
+
+def _read_resolved_cache(cache_path: Path) -> Optional[Path]:
+    """Return the cached package binary if the bin directory is unchanged."""
+
+    try:
+        mtime, _, cached = cache_path.read_text(encoding="utf-8").partition("\n")
+        current = PACKAGE_BIN_DIR.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    if mtime != str(current):
+        return None
+    candidate = Path(cached.strip())
+    if candidate.is_file() and os.access(candidate, os.X_OK):
+        return candidate
     return None
 
 
+def _write_resolved_cache(cache_path: Path, candidate: Path) -> None:
+    # Create the file first: adding a directory entry bumps the bin dir mtime,
+    # and the stored mtime must be the one observed after that.
+    try:
+        cache_path.touch()
+        mtime = PACKAGE_BIN_DIR.stat().st_mtime_ns
+        cache_path.write_text(f"{mtime}\n{candidate}\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
+resolve_crest_binary.cache_clear = _locate_binary_cached.cache_clear  # type: ignore[attr-defined]
+resolve_xtb_binary.cache_clear = _locate_binary_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def _install_binary(
     *,
     url: str,
@@ -123,12 +209,17 @@ def _install_binary(
     force: bool,
 ) -> Path:
     PACKAGE_BIN_DIR.mkdir(parents=True, exist_ok=True)
+    final_path = PACKAGE_BIN_DIR / expected_binary
+    if final_path.exists() and not force:
+        return final_path
+
     archive_path = PACKAGE_BIN_DIR / archive_name
 
-    if archive_path.exists():
+    if archive_path.exists() and (force or archive_path.stat().st_size != _remote_size(url)):
         archive_path.unlink()
 
-    urllib.request.urlretrieve(url, archive_path)
+    if not archive_path.exists():
+        urllib.request.urlretrieve(url, archive_path)
 
     extract_dir = PACKAGE_BIN_DIR / f"_{expected_binary}_extract"
     if extract_dir.exists():
@@ -136,7 +227,10 @@ def _install_binary(
     extract_dir.mkdir()
 
     with tarfile.open(archive_path, mode="r:xz") as tar:
-        tar.extractall(path=extract_dir, filter="data")
+        for member in tar:
+            if member.isfile() and Path(member.name).name == expected_binary:
+                tar.extract(member, path=extract_dir, filter="data")
+                break
 
     archive_path.unlink(missing_ok=True)
 
@@ -146,11 +240,6 @@ def _install_binary(
         shutil.rmtree(extract_dir, ignore_errors=True)
         raise FileNotFoundError(f"Failed to locate {expected_binary} inside extracted archive")
 
-    final_path = PACKAGE_BIN_DIR / expected_binary
-    if final_path.exists() and not force:
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        return final_path
-
     if final_path.exists():
         final_path.unlink()
     shutil.move(str(binary_path), final_path)
@@ -162,10 +251,44 @@ def _install_binary(
     return final_path
 
 
+def _remote_size(url: str) -> Optional[int]:
+    """Return the Content-Length advertised for *url*, or None if unknown."""
+
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request) as response:
+            length = response.headers.get("Content-Length")
+    except (OSError, ValueError):
+        return None
+    return int(length) if length and length.isdigit() else None
+
+
 def _promote_binary(root: Path, binary_name: str) -> Optional[Path]:
-    for candidate in root.rglob(binary_name):
-        if candidate.is_file():
-            return candidate
+    return _scan_for(root, binary_name, executable=False)
+
+
+def _scan_for(root: Path, binary_name: str, *, executable: bool) -> Optional[Path]:
+    """Depth-first search for a regular file named *binary_name* under *root*.
+
+    Works on ``os.DirEntry`` objects so names are compared without building a
+    Path per entry and file-type checks reuse the cached ``d_type``.
+    """
+
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif (
+                        entry.name == binary_name
+                        and entry.is_file()
+                        and (not executable or os.access(entry.path, os.X_OK))
+                    ):
+                        return Path(entry.path)
+        except OSError:
+            continue
     return None
 
 
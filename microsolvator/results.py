@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import shlex
+from functools import cached_property
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
-from ase import Atoms
+if TYPE_CHECKING:
+    from ase import Atoms
 
 
 @dataclass
@@ -34,7 +36,7 @@ class MicrosolvationResult:
         if not self.ensemble and self.best_structure is None and self.final is None:
             raise ValueError("Microsolvation run produced no structures")
 
-    @property
+    @cached_property
     def shell_command(self) -> str:
         """Return the command as a shell-escaped string."""
 
@@ -2,32 +2,58 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import inspect
 import os
 import shlex
+import shutil
 import subprocess
 import tempfile
 import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import replace
 from pathlib import Path
-from typing import Callable, Optional, Sequence, Set
-
-from ase import Atoms
-from ase.io import read as ase_read, write as ase_write
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
+from ._xyz import format_xyz
 from .command import build_crest_command
 from .config import MicrosolvatorConfig
 from .install import resolve_crest_binary, resolve_xtb_binary
 from .results import MicrosolvationResult
 from .support import validate_implicit_choice
 
+if TYPE_CHECKING:
+    from ase import Atoms
+
 
 RunCommand = Callable[..., subprocess.CompletedProcess[str]]
 
+# Constraint sets larger than this are sorted with numpy; below it the import
+# cost outweighs the faster sort.
+_NUMPY_SORT_THRESHOLD = 512
+
+# Keyword arguments that each public ``log_mode`` passes to the default runner.
+_LOG_MODES: Dict[str, Dict[str, bool]] = {
+    "stream": {},
+    "buffered": {"stream_log": False},
+    "merged": {"merge_streams": True},
+}
+
+_XYZ_CACHE_SIZE = 32
+_xyz_cache: "OrderedDict[Tuple[bytes, bytes], str]" = OrderedDict()
+_xyz_cache_lock = threading.Lock()
+
 
 class Microsolvator:
     """Coordinate CREST microsolvation jobs from ASE inputs."""
 
+    _arena: Optional[Path] = None
+    _arena_lock = threading.Lock()
+
     @classmethod
     def run(
         cls,
@@ -42,24 +68,51 @@ class Microsolvator:
         run_command: Optional[RunCommand] = None,
         prepare_only: bool = False,
         log_file: Optional[str] = "crest_run.log",
+        materialize: bool = True,
+        share_frames: bool = False,
+        log_mode: str = "stream",
     ) -> MicrosolvationResult:
-        """Execute a CREST microsolvation run and return parsed results."""
+        """Execute a CREST microsolvation run and return parsed results.
 
-        if config.implicit_model and config.implicit_solvent:
-            validate_implicit_choice(
-                method=config.method,
-                model=config.implicit_model,
-                solvent=config.implicit_solvent,
-            )
+        With ``prepare_only=True, materialize=False`` nothing is written to
+        disk; only the command is built and printed.  This mode needs an
+        explicit ``working_directory``.
+
+        With ``share_frames=True``, identical frames in the parsed ensemble
+        and trajectory are returned as the same :class:`ase.Atoms` object,
+        so mutating one in place also mutates its duplicates.
 
-        executor = run_command or _default_runner
+        ``log_mode`` selects how the default runner writes ``log_file``:
+        ``"stream"`` tags and writes lines as they arrive, ``"buffered"``
+        captures the output and writes the log once CREST exits, and
+        ``"merged"`` folds stderr into stdout so every line is tagged
+        ``[OUT]`` and ``result.stderr`` is empty.  It cannot be combined
+        with a custom ``run_command``.
+        """
+
+        if not materialize:
+            if not prepare_only:
+                raise ValueError("materialize=False requires prepare_only=True")
+            if working_directory is None:
+                raise ValueError("materialize=False requires a working_directory")
+
+        if log_mode not in _LOG_MODES:
+            raise ValueError(f"Unknown log_mode {log_mode!r}; expected one of {sorted(_LOG_MODES)}")
+        if run_command is not None and log_mode != "stream":
+            raise ValueError("log_mode only applies to the default runner")
+
+        # Re-checked here because the config may have been mutated after construction.
+        _validate_implicit(config)
+
+        executor = run_command or functools.partial(_default_runner, **_LOG_MODES[log_mode])
 
         if prepare_only and not keep_temps and working_directory is None:
             keep_temps = True
 
         if working_directory is not None:
             workdir = Path(working_directory)
-            workdir.mkdir(parents=True, exist_ok=True)
+            if materialize:
+                workdir.mkdir(parents=True, exist_ok=True)
             return cls._execute(
                 solute=solute,
                 solvent=solvent,
@@ -70,6 +123,8 @@ class Microsolvator:
                 executor=executor,
                 prepare_only=prepare_only,
                 log_file=log_file,
+                materialize=materialize,
+                share_frames=share_frames,
             )
 
         if keep_temps:
@@ -84,10 +139,12 @@ class Microsolvator:
                 executor=executor,
                 prepare_only=prepare_only,
                 log_file=log_file,
+                materialize=materialize,
+                share_frames=share_frames,
             )
 
-        with tempfile.TemporaryDirectory(prefix="microsolvator_") as tmpdir:
-            workdir = Path(tmpdir)
+        workdir = cls._arena_subdir()
+        try:
             return cls._execute(
                 solute=solute,
                 solvent=solvent,
@@ -98,7 +155,127 @@ class Microsolvator:
                 executor=executor,
                 prepare_only=prepare_only,
                 log_file=log_file,
+                materialize=materialize,
+                share_frames=share_frames,
             )
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    @classmethod
+    def _arena_subdir(cls) -> Path:
+        """Return a fresh per-run directory inside the shared arena.
+
+        The arena is created once per process and removed at exit, so
+        throwaway runs only create and delete their own subdirectory.
+        """
+
+        with cls._arena_lock:
+            if cls._arena is None or not cls._arena.is_dir():
+                cls._arena = Path(tempfile.mkdtemp(prefix="microsolvator_arena_"))
+                atexit.register(shutil.rmtree, cls._arena, ignore_errors=True)
+            arena = cls._arena
+        workdir = arena / uuid.uuid4().hex
+        workdir.mkdir()
+        return workdir
+
+    @classmethod
+    def run_batch(
+        cls,
+        jobs: Sequence[Mapping[str, Any]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> List[MicrosolvationResult]:
+        """Execute several independent runs concurrently.
+
+        Each job is a mapping of keyword arguments for :meth:`run`.  CREST
+        does its work in a subprocess, so a thread pool is enough to overlap
+        jobs.  By default the pool is sized so that the combined ``threads``
+        of concurrent jobs does not exceed the CPU count.  Results are
+        returned in job order.  On the first failure, jobs that have not
+        started are cancelled, running ones are waited for, and the error
+        is re-raised.  Jobs must not share a ``working_directory``.
+        """
+
+        if not jobs:
+            return []
+
+        if max_workers is None:
+            per_job = max(job["config"].threads for job in jobs)
+            max_workers = max(1, (os.cpu_count() or 1) // max(per_job, 1))
+
+        failed = threading.Event()
+
+        def run_job(job: Mapping[str, Any]) -> Optional[MicrosolvationResult]:
+            # A worker may pick up the next job before the pool is shut down.
+            if failed.is_set():
+                return None
+            try:
+                return cls.run(**job)
+            except BaseException:
+                failed.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            futures = [pool.submit(run_job, job) for job in jobs]
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            if pending:
+                pool.shutdown(wait=True, cancel_futures=True)
+            for future in futures:
+                if not future.cancelled() and future.exception() is not None:
+                    raise future.exception()
+            return [future.result() for future in futures]
+
+    @classmethod
+    def build_command(
+        cls,
+        *,
+        config: MicrosolvatorConfig,
+        working_directory: Path,
+        solute_length: int = 0,
+        constrained_indices: Optional[Sequence[int]] = None,
+        constrain_solute: bool = False,
+    ) -> str:
+        """Return the shell command a run in *working_directory* would execute.
+
+        Nothing is written to disk; the inputs can be generated later with
+        ``run(..., prepare_only=True)`` for the same directory.
+        ``constrain_solute=True`` needs the solute's atom count as
+        ``solute_length``.
+        """
+
+        if constrain_solute and solute_length < 1:
+            raise ValueError("constrain_solute=True requires solute_length >= 1")
+
+        _validate_implicit(config)
+        indices = _constraint_indices(
+            solute_length=solute_length,
+            constrained_indices=constrained_indices,
+            constrain_solute=constrain_solute,
+        )
+        command = cls._build_command(
+            config=config, workdir=Path(working_directory), constrained=bool(indices)
+        )
+        return shlex.join(command)
+
+    @classmethod
+    def _build_command(
+        cls,
+        *,
+        config: MicrosolvatorConfig,
+        workdir: Path,
+        constrained: bool,
+    ) -> List[str]:
+        exec_config = config
+        if constrained and not config.nopreopt:
+            exec_config = replace(config, nopreopt=True)
+
+        return build_crest_command(
+            config=exec_config,
+            crest_executable=resolve_crest_binary(exec_config.crest_executable),
+            xtb_executable=resolve_xtb_binary(exec_config.xtb_executable),
+            solute_path=workdir / "solute.xyz",
+            solvent_path=workdir / "solvent.xyz",
+        )
 
     @classmethod
     def _execute(
@@ -113,36 +290,18 @@ class Microsolvator:
         executor: RunCommand,
         prepare_only: bool,
         log_file: Optional[str],
+        materialize: bool = True,
+        share_frames: bool = False,
     ) -> MicrosolvationResult:
-        workdir.mkdir(parents=True, exist_ok=True)
-
-        solute_path = workdir / "solute.xyz"
-        solvent_path = workdir / "solvent.xyz"
-
-        ase_write(solute_path, solute, format='xyz')
-        ase_write(solvent_path, solvent, format='xyz')
-
-        constraints_written = _write_constraints(
-            workdir=workdir,
+        indices = _constraint_indices(
             solute_length=len(solute),
             constrained_indices=constrained_indices,
             constrain_solute=constrain_solute,
         )
+        if materialize:
+            _materialize_inputs(workdir=workdir, solute=solute, solvent=solvent, indices=indices)
 
-        exec_config = config
-        if constraints_written and not config.nopreopt:
-            exec_config = replace(config, nopreopt=True)
-
-        crest_executable = resolve_crest_binary(exec_config.crest_executable)
-        xtb_executable = resolve_xtb_binary(exec_config.xtb_executable)
-
-        command = build_crest_command(
-            config=exec_config,
-            crest_executable=crest_executable,
-            xtb_executable=xtb_executable,
-            solute_path=solute_path,
-            solvent_path=solvent_path,
-        )
+        command = cls._build_command(config=config, workdir=workdir, constrained=bool(indices))
 
         if prepare_only:
             command_str = shlex.join(command)
@@ -187,10 +346,10 @@ class Microsolvator:
             completed = executor(command, workdir)
 
         best_structure = _read_optional_atoms(workdir / "crest_best.xyz")
-        ensemble = _read_optional_ensemble(workdir / "full_ensemble.xyz")
+        ensemble = _read_optional_ensemble(workdir / "full_ensemble.xyz", share_frames=share_frames)
         grow_dir = workdir / "grow"
         final_cluster = _read_optional_atoms(grow_dir / "cluster.xyz")
-        traj = _read_optional_ensemble(grow_dir / "qcg_grow.xyz")
+        traj = _read_optional_ensemble(grow_dir / "qcg_grow.xyz", share_frames=share_frames)
         population_path = (workdir / "full_population.dat") if (workdir / "full_population.dat").exists() else None
 
         result = MicrosolvationResult(
@@ -208,6 +367,26 @@ class Microsolvator:
         return result
 
 
+def read_tail(path: Union[str, "os.PathLike[str]"], nbytes: int = 65536) -> str:
+    """Return the last *nbytes* of a (log) file without reading the whole file."""
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        os.lseek(fd, max(0, size - nbytes), os.SEEK_SET)
+        chunks = []
+        remaining = min(size, nbytes)
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+
 def _count_positional_params(func: Callable) -> int:
     """Count the number of positional parameters a callable accepts."""
     try:
@@ -226,13 +405,21 @@ def _default_runner(
     workdir: Path,
     env: Optional[dict[str, str]] = None,
     log_path: Optional[str] = None,
+    *,
+    stream_log: bool = True,
+    merge_streams: bool = False,
 ) -> subprocess.CompletedProcess[str]:
+    if merge_streams:
+        return _run_merged(command, workdir, env, Path(log_path) if log_path else None)
+
     if log_path:
-        return _run_with_logging(command, workdir, env, Path(log_path))
+        if stream_log:
+            return _run_with_logging(command, workdir, env, Path(log_path))
+        return _run_then_log(command, workdir, env, Path(log_path))
 
     return subprocess.run(
         command,
-        cwd=str(workdir),
+        cwd=workdir,
         check=True,
         capture_output=True,
         text=True,
@@ -240,6 +427,85 @@ def _default_runner(
     )
 
 
+def _run_merged(
+    command: Sequence[str],
+    workdir: Path,
+    env: Optional[dict[str, str]],
+    log_path: Optional[Path],
+) -> subprocess.CompletedProcess[str]:
+    """Run with stderr redirected into stdout and read the single pipe inline.
+
+    The kernel interleaves both streams in the order they were written, so
+    no reader threads are needed.  Every line is logged with the ``[OUT]``
+    prefix, the combined text is returned as ``stdout`` and ``stderr`` is
+    empty.
+    """
+
+    lines: list[str] = []
+    with contextlib.ExitStack() as stack:
+        log_file = (
+            stack.enter_context(open(log_path, "w", encoding="utf-8")) if log_path else None
+        )
+        process = stack.enter_context(
+            subprocess.Popen(
+                command,
+                cwd=workdir,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+        )
+        assert process.stdout is not None
+        for line in process.stdout:
+            if log_file is not None:
+                log_file.write(f"[OUT] {line}")
+                log_file.flush()
+            lines.append(line)
+        returncode = process.wait()
+
+    stdout = "".join(lines)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, output=stdout, stderr="")
+
+    return subprocess.CompletedProcess(
+        args=command,
+        returncode=returncode,
+        stdout=stdout,
+        stderr="",
+    )
+
+
+def _run_then_log(
+    command: Sequence[str],
+    workdir: Path,
+    env: Optional[dict[str, str]],
+    log_path: Path,
+) -> subprocess.CompletedProcess[str]:
+    """Capture both streams with ``communicate`` and write the log once at exit.
+
+    Cheaper than line-by-line streaming, but the log only appears when the
+    process finishes and stdout lines precede stderr lines instead of being
+    interleaved.
+    """
+
+    completed = subprocess.run(
+        command,
+        cwd=workdir,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    log_path.write_text(
+        "".join(f"[OUT] {line}\n" for line in completed.stdout.splitlines())
+        + "".join(f"[ERR] {line}\n" for line in completed.stderr.splitlines()),
+        encoding="utf-8",
+    )
+    completed.check_returncode()
+    return completed
+
+
 def _run_with_logging(
     command: Sequence[str],
     workdir: Path,
@@ -252,7 +518,7 @@ def _run_with_logging(
     with open(log_path, "w", encoding="utf-8") as log_file:
         process = subprocess.Popen(
             command,
-            cwd=str(workdir),
+            cwd=workdir,
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -309,19 +575,64 @@ def _build_subprocess_env(
     xtb_executable: str,
     crest_executable: str,
 ) -> dict[str, str]:
-    env = os.environ.copy()
-    env["CREST_BIN"] = crest_executable
-    env["XTB_BIN"] = xtb_executable
-    return env
+    return dict(os.environ, CREST_BIN=crest_executable, XTB_BIN=xtb_executable)
+
 
+def _xyz_text(atoms: Atoms) -> str:
+    """Return the XYZ serialization of *atoms*, reusing it for identical inputs.
 
-def _write_constraints(
+    Sweeps typically pass the same solute and solvent to every run, so the
+    formatted text is cached on the atomic numbers and positions.
+    """
+
+    key = (atoms.numbers.tobytes(), atoms.positions.tobytes())
+    with _xyz_cache_lock:
+        text = _xyz_cache.get(key)
+        if text is not None:
+            _xyz_cache.move_to_end(key)
+            return text
+
+    text = format_xyz([atoms])
+    with _xyz_cache_lock:
+        _xyz_cache[key] = text
+        if len(_xyz_cache) > _XYZ_CACHE_SIZE:
+            _xyz_cache.popitem(last=False)
+    return text
+
+
+def _materialize_inputs(
     *,
     workdir: Path,
+    solute: Atoms,
+    solvent: Atoms,
+    indices: Set[int],
+) -> None:
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    with open(workdir / "solute.xyz", "w", encoding="utf-8") as solute_file, open(
+        workdir / "solvent.xyz", "w", encoding="utf-8"
+    ) as solvent_file:
+        solute_file.write(_xyz_text(solute))
+        solvent_file.write(_xyz_text(solvent))
+
+    _write_constraint_file(workdir, indices)
+
+
+def _validate_implicit(config: MicrosolvatorConfig) -> None:
+    if config.implicit_model and config.implicit_solvent:
+        validate_implicit_choice(
+            method=config.method,
+            model=config.implicit_model,
+            solvent=config.implicit_solvent,
+        )
+
+
+def _constraint_indices(
+    *,
     solute_length: int,
     constrained_indices: Optional[Sequence[int]],
     constrain_solute: bool,
-) -> bool:
+) -> Set[int]:
     indices: Set[int] = set()
 
     if constrain_solute:
@@ -333,27 +644,97 @@ def _write_constraints(
                 raise ValueError("Constraint indices must be 1-based and positive")
             indices.add(index)
 
+    return indices
+
+
+def _write_constraint_file(workdir: Path, indices: Set[int]) -> bool:
     if not indices:
         return False
 
-    content_lines = ["$constrain", "atoms: " + ",".join(str(i) for i in sorted(indices)), "$end", ""]
-    (workdir / ".xcontrol").write_text("\n".join(content_lines), encoding="utf-8")
+    atoms_str = ",".join(map(str, _sorted_indices(indices)))
+    content = f"$constrain\natoms: {atoms_str}\n$end\n"
+    _write_bytes_fast(workdir / ".xcontrol", content.encode("ascii"))
     return True
 
 
+def _write_bytes_fast(path: Path, data: bytes) -> None:
+    """Write a small file through a raw descriptor, bypassing the text I/O stack."""
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _sorted_indices(indices: Set[int]) -> list[int]:
+    if len(indices) <= _NUMPY_SORT_THRESHOLD:
+        return sorted(indices)
+
+    import numpy as np
+
+    array = np.fromiter(indices, dtype=np.int64, count=len(indices))
+    array.sort()
+    return array.tolist()
+
+
 def _read_optional_atoms(path: Path) -> Optional[Atoms]:
     if not path.exists():
         return None
+    from ase.io import read as ase_read
+
     try:
         return ase_read(path)
     except FileNotFoundError:
         return None
 
 
-def _read_optional_ensemble(path: Path) -> list[Atoms]:
+def _read_optional_ensemble(path: Path, *, share_frames: bool = False) -> list[Atoms]:
     if not path.exists():
         return []
+    from ase.io.extxyz import read_xyz
+
     try:
-        return list(ase_read(path, index=":"))
+        with open(path, encoding="utf-8") as handle:
+            frames = list(read_xyz(handle, index=slice(None)))
     except FileNotFoundError:
         return []
+    if share_frames:
+        return _intern_frames(frames)
+    return frames
+
+
+def _intern_frames(frames: List[Atoms]) -> List[Atoms]:
+    """Replace repeated frames with references to their first occurrence."""
+
+    import numpy as np
+
+    seen: Dict[Tuple[Any, ...], Atoms] = {}
+    return [seen.setdefault(_frame_key(atoms, np.ndarray), atoms) for atoms in frames]
+
+
+def _frame_key(atoms: Atoms, ndarray: type) -> Tuple[Any, ...]:
+    """Return a hashable key covering everything a parsed frame carries."""
+
+    calc = atoms.calc
+    return (
+        _value_key(atoms.cell.array, ndarray),
+        _value_key(atoms.pbc, ndarray),
+        _value_key(atoms.arrays, ndarray),
+        _value_key(atoms.info, ndarray),
+        _value_key([constraint.todict() for constraint in atoms.constraints], ndarray),
+        _value_key(calc.results if calc is not None else None, ndarray),
+    )
+
+
+def _value_key(value: Any, ndarray: type) -> Any:
+    if isinstance(value, ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(name), _value_key(item, ndarray)) for name, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_value_key(item, ndarray) for item in value)
+    return (type(value).__name__, repr(value))
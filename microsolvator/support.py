@@ -2,148 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Tuple
+import functools
+import json
+from importlib import resources
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from .config import _method_flag
 
 
-_SOLVENT_TABLE: Dict[str, Dict[str, Dict[str, bool]]] = {
-    "gfn1": {
-        "alpb": {
-            "acetone": True,
-            "acetonitrile": True,
-            "aniline": True,
-            "benzaldehyde": True,
-            "benzene": True,
-            "ch2cl2": True,
-            "chcl3": True,
-            "cs2": True,
-            "dioxane": True,
-            "dmf": True,
-            "dmso": True,
-            "ether": True,
-            "ethylacetate": True,
-            "furane": True,
-            "hexadecane": True,
-            "hexane": True,
-            "methanol": True,
-            "nitromethane": True,
-            "octanol": True,
-            "phenol": True,
-            "toluene": True,
-            "thf": True,
-            "h2o": True,
-        },
-        "gbsa": {
-            "acetone": True,
-            "acetonitrile": True,
-            "aniline": False,
-            "benzaldehyde": False,
-            "benzene": True,
-            "ch2cl2": True,
-            "chcl3": True,
-            "cs2": True,
-            "dioxane": False,
-            "dmf": False,
-            "dmso": True,
-            "ether": True,
-            "ethylacetate": False,
-            "furane": False,
-            "hexadecane": False,
-            "hexane": False,
-            "methanol": True,
-            "nitromethane": False,
-            "octanol": False,
-            "phenol": False,
-            "toluene": True,
-            "thf": True,
-            "h2o": True,
-        },
-    },
-    "gfn2": {
-        "alpb": {
-            "acetone": True,
-            "acetonitrile": True,
-            "aniline": True,
-            "benzaldehyde": True,
-            "benzene": True,
-            "ch2cl2": True,
-            "chcl3": True,
-            "cs2": True,
-            "dioxane": True,
-            "dmf": True,
-            "dmso": True,
-            "ether": True,
-            "ethylacetate": True,
-            "furane": True,
-            "hexadecane": True,
-            "hexane": True,
-            "methanol": True,
-            "nitromethane": True,
-            "octanol": True,
-            "phenol": True,
-            "toluene": True,
-            "thf": True,
-            "h2o": True,
-        },
-        "gbsa": {
-            "acetone": True,
-            "acetonitrile": True,
-            "aniline": False,
-            "benzaldehyde": False,
-            "benzene": True,
-            "ch2cl2": True,
-            "chcl3": True,
-            "cs2": True,
-            "dioxane": False,
-            "dmf": True,
-            "dmso": True,
-            "ether": True,
-            "ethylacetate": False,
-            "furane": False,
-            "hexadecane": False,
-            "hexane": True,
-            "methanol": True,
-            "nitromethane": False,
-            "octanol": False,
-            "phenol": False,
-            "toluene": True,
-            "thf": True,
-            "h2o": True,
-        },
-    },
-    "gfnff": {
-        "alpb": {
-            "acetone": True,
-            "acetonitrile": True,
-            "aniline": True,
-            "benzaldehyde": True,
-            "benzene": True,
-            "ch2cl2": True,
-            "chcl3": True,
-            "cs2": True,
-            "dioxane": True,
-            "dmf": True,
-            "dmso": True,
-            "ether": True,
-            "ethylacetate": True,
-            "furane": True,
-            "hexadecane": True,
-            "hexane": True,
-            "methanol": True,
-            "nitromethane": True,
-            "octanol": True,
-            "phenol": True,
-            "toluene": True,
-            "thf": True,
-            "h2o": True,
-        }
-    },
-}
+@functools.lru_cache(maxsize=None)
+def _load_table() -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """Load the packaged method -> model -> supported solvents table."""
+
+    raw = resources.files(__package__).joinpath("data/solvents.json").read_bytes()
+    return {
+        method_key: {model_key: tuple(solvents) for model_key, solvents in models.items()}
+        for method_key, models in json.loads(raw).items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _supported() -> FrozenSet[Tuple[str, str, str]]:
+    return frozenset(
+        (method_key, model_key, solvent)
+        for method_key, models in _load_table().items()
+        for model_key, solvents in models.items()
+        for solvent in solvents
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _solvents_by_pair() -> Dict[Tuple[str, str], FrozenSet[str]]:
+    return {
+        (method_key, model_key): frozenset(solvents)
+        for method_key, models in _load_table().items()
+        for model_key, solvents in models.items()
+    }
 
 
 def _normalize_method(method: str) -> str:
-    """Normalize method name to match _SOLVENT_TABLE keys."""
+    """Normalize method name to match the solvent table keys."""
     try:
         return _method_flag(method)
     except ValueError:
@@ -153,19 +51,7 @@ def _normalize_method(method: str) -> str:
 def supports_implicit_solvent(*, method: str, model: str, solvent: str) -> bool:
     """Return True if the method/model/solvent combination is supported."""
 
-    method_key = _normalize_method(method)
-    model_key = model.lower()
-    solvent_key = solvent.lower()
-
-    method_entry = _SOLVENT_TABLE.get(method_key)
-    if method_entry is None:
-        return False
-
-    model_entry = method_entry.get(model_key)
-    if model_entry is None:
-        return False
-
-    return model_entry.get(solvent_key, False)
+    return _supports(_normalize_method(method), model.lower(), solvent.lower())
 
 
 def list_supported_implicit_solvents(
@@ -173,25 +59,57 @@ def list_supported_implicit_solvents(
 ) -> Dict[str, Dict[str, Tuple[str, ...]]]:
     """Return a filtered view of supported solvents.
 
-    The result groups solvents by method and model where the support flag is True.
+    The result groups supported solvents by method and model.
     """
 
+    cached = _list_supported(
+        _normalize_method(method) if method else None,
+        model.lower() if model else None,
+    )
+    return {method_key: dict(models) for method_key, models in cached.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _supports(method_key: str, model_key: str, solvent_key: str) -> bool:
+    return (method_key, model_key, solvent_key) in _supported()
+
+
+@functools.lru_cache(maxsize=None)
+def _list_supported(
+    method_key: Optional[str], model_key: Optional[str]
+) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    # Shared between callers; list_supported_implicit_solvents hands out copies.
+    if method_key and model_key:
+        solvents = _solvents_by_pair().get((method_key, model_key))
+        return {method_key: {model_key: tuple(sorted(solvents))}} if solvents else {}
+
     data: Dict[str, Dict[str, Tuple[str, ...]]] = {}
-    for method_key, models in _SOLVENT_TABLE.items():
-        if method and method_key != _normalize_method(method):
+    for table_method, models in _load_table().items():
+        if method_key and table_method != method_key:
             continue
-        data[method_key] = {}
-        for model_key, solvents in models.items():
-            if model and model_key != model.lower():
+        data[table_method] = {}
+        for table_model, solvents in models.items():
+            if model_key and table_model != model_key:
                 continue
-            supported = tuple(sorted(solvent for solvent, ok in solvents.items() if ok))
+            supported = tuple(sorted(solvents))
             if supported:
-                data[method_key][model_key] = supported
-        if not data[method_key]:
-            data.pop(method_key)
+                data[table_method][table_model] = supported
+        if not data[table_method]:
+            data.pop(table_method)
     return data
 
 
+def _cache_clear() -> None:
+    """Drop every cached view of the solvent table."""
+
+    for cached in (_load_table, _supported, _solvents_by_pair, _supports, _list_supported):
+        cached.cache_clear()
+
+
+supports_implicit_solvent.cache_clear = _cache_clear  # type: ignore[attr-defined]
+list_supported_implicit_solvents.cache_clear = _cache_clear  # type: ignore[attr-defined]
+
+
 def validate_implicit_choice(*, method: str, model: str, solvent: str) -> None:
     """Raise ValueError if the combination is unsupported."""
 
@@ -0,0 +1,11 @@
+import pytest
+
+from microsolvator.install import resolve_crest_binary
+
+
+@pytest.fixture(autouse=True)
+def _clear_resolver_cache():
+    """Keep cached binary lookups from leaking between tests."""
+    resolve_crest_binary.cache_clear()
+    yield
+    resolve_crest_binary.cache_clear()
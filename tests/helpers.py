@@ -0,0 +1,28 @@
+"""Structures and stub executables shared by the unit tests."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+from ase import Atoms
+
+
+# Built once and copied per use; constructing Atoms is comparatively costly.
+_H2O_POS = np.array([[0.0, 0.0, 0.0], [0.9, 0.0, 0.0], [0.0, 0.7, 0.0]])
+_H2O_POS_SHIFT = np.array([[0.0, 0.0, 0.0], [0.9, 0.0, 0.0], [0.0, 0.8, 0.0]])
+# Atoms copies the positions array, so the templates never alias these.
+_H2O = Atoms("H2O", positions=_H2O_POS)
+_H2O_SHIFTED = Atoms("H2O", positions=_H2O_POS_SHIFT)
+
+_EXEC_PAYLOAD = b"#!/bin/sh\nexit 0\n"
+_POPULATION_PAYLOAD = b"1 0.5\n"
+
+
+def _write_executable(path: Path) -> Path:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        os.write(fd, _EXEC_PAYLOAD)
+    finally:
+        os.close(fd)
+    os.chmod(path, 0o755)  # the umask may have stripped the exec bits
+    return path
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import subprocess
 import sys
+import tarfile
 from pathlib import Path
 
 if sys.version_info >= (3, 11):
@@ -24,7 +25,6 @@ else:
 from typing import Optional, Sequence
 
 import pytest
-from ase import Atoms
 from ase.io import write as ase_write
 
 from microsolvator import (
@@ -34,36 +34,39 @@ from microsolvator import (
     list_supported_implicit_solvents,
     supports_implicit_solvent,
 )
+from microsolvator import install as install_utils
 from microsolvator.config import _method_flag
 from microsolvator.install import (
     PACKAGE_BIN_DIR,
     _install_binary,
     _promote_binary,
 )
+from microsolvator import runner as runner_module
 from microsolvator.runner import _count_positional_params
 from microsolvator.support import _normalize_method, validate_implicit_choice
 
+from helpers import (
+    _H2O,
+    _H2O_SHIFTED,
+    _POPULATION_PAYLOAD,
+    _write_executable,
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _write_executable(path: Path) -> Path:
-    path.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
-    path.chmod(0o755)
-    return path
-
-
 def _fake_outputs(workdir: Path) -> None:
     """Write minimal output files that Microsolvator expects after a run."""
-    best = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.8, 0]])
+    best = _H2O_SHIFTED.copy()
     ase_write(workdir / "crest_best.xyz", best)
     ase_write(workdir / "full_ensemble.xyz", [best, best.copy()])
     grow_dir = workdir / "grow"
     grow_dir.mkdir(exist_ok=True)
     ase_write(grow_dir / "cluster.xyz", best)
     ase_write(grow_dir / "qcg_grow.xyz", [best])
-    (workdir / "full_population.dat").write_text("1 0.5\n", encoding="utf-8")
+    (workdir / "full_population.dat").write_bytes(_POPULATION_PAYLOAD)
 
 
 # ===================================================================
@@ -71,7 +74,7 @@ def _fake_outputs(workdir: Path) -> None:
 # ===================================================================
 
 class TestMethodNormalization:
-    """_normalize_method and _SOLVENT_TABLE key consistency."""
+    """_normalize_method and solvent table key consistency."""
 
     @pytest.mark.parametrize(
         "alias, expected",
@@ -119,6 +122,12 @@ class TestMethodNormalization:
         assert "gfnff" in data
         assert "alpb" in data["gfnff"]
 
+    def test_list_supported_returns_independent_copies(self):
+        first = list_supported_implicit_solvents(method="GFN2", model="ALPB")
+        first["gfn2"].pop("alpb")
+        second = list_supported_implicit_solvents(method="gfn2", model="alpb")
+        assert "h2o" in second["gfn2"]["alpb"]
+
     def test_validate_implicit_choice_raises_on_unsupported(self):
         with pytest.raises(ValueError, match="Unsupported implicit solvent"):
             validate_implicit_choice(method="gfn2", model="gbsa", solvent="aniline")
@@ -182,8 +191,8 @@ class TestExecutorDispatch:
         return config
 
     def _solute_and_solvent(self):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
-        solvent = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+        solute = _H2O.copy()
+        solvent = _H2O.copy()
         return solute, solvent
 
     def test_dispatch_4_params(self, tmp_path: Path):
@@ -308,6 +317,37 @@ class TestInstallForceFlag:
     def test_promote_binary_returns_none_when_missing(self, tmp_path: Path):
         assert _promote_binary(tmp_path, "nonexistent") is None
 
+    @staticmethod
+    def _make_archive(tmp_path: Path) -> Path:
+        source = tmp_path / "src" / "pkg" / "bin"
+        source.mkdir(parents=True)
+        _write_executable(source / "crest")
+        (source.parent / "README").write_text("docs\n", encoding="utf-8")
+        archive = tmp_path / "crest.tar.xz"
+        with tarfile.open(archive, mode="w:xz") as tar:
+            tar.add(tmp_path / "src" / "pkg", arcname="pkg")
+        return archive
+
+    def test_install_without_force_skips_download(self, tmp_path: Path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        monkeypatch.setattr(install_utils, "PACKAGE_BIN_DIR", bin_dir)
+        url = self._make_archive(tmp_path).as_uri()
+
+        installed = _install_binary(
+            url=url, archive_name="crest.tar.xz", expected_binary="crest", force=False
+        )
+        assert installed == bin_dir / "crest"
+        assert sorted(p.name for p in bin_dir.iterdir()) == ["crest"]
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("download should be skipped")
+
+        monkeypatch.setattr(install_utils.urllib.request, "urlretrieve", _fail)
+        again = _install_binary(
+            url=url, archive_name="crest.tar.xz", expected_binary="crest", force=False
+        )
+        assert again == installed
+
 
 # ===================================================================
 # 4. config.py — _method_flag edge cases & build_flag_list validation
@@ -413,6 +453,21 @@ class TestBuildFlagList:
         flags = config.build_flag_list()
         assert flags[flags.index("--enslvl") + 1] == "gfnff"
 
+    def test_cached_flags_are_independent_copies(self):
+        config = MicrosolvatorConfig(nsolv=1, method="gfn2")
+        first = config.build_flag_list()
+        first.append("--mutated")
+        assert "--mutated" not in config.build_flag_list()
+
+    def test_cached_flags_follow_field_changes(self):
+        config = MicrosolvatorConfig(nsolv=1, method="gfn2", mdtime=50)
+        assert config.build_flag_list()[config.build_flag_list().index("--mdtime") + 1] == "50"
+        config.mdtime = 50.0
+        config.nsolv = 4
+        flags = config.build_flag_list()
+        assert flags[flags.index("--mdtime") + 1] == "50.0"
+        assert flags[flags.index("--nsolv") + 1] == "4"
+
 
 # ===================================================================
 # 5. Version consistency
@@ -432,17 +487,18 @@ class TestVersionConsistency:
 
 
 # ===================================================================
-# 6. Microsolvator.run integration — validate_implicit_choice with aliases
+# 6. Implicit solvent validation with method aliases
 # ===================================================================
 
 class TestRunImplicitValidation:
-    """Microsolvator.run calls validate_implicit_choice with the user's method string.
-    Ensure it works for all aliases without raising false positives.
+    """MicrosolvatorConfig and Microsolvator.run validate the implicit solvent
+    choice with the user's method string. Ensure it works for all aliases
+    without raising false positives.
     """
 
     @pytest.mark.parametrize("method_alias", ["gfn2", "gfn-2", "GFN2"])
     def test_run_prepare_only_accepts_method_aliases(self, tmp_path: Path, method_alias: str):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+        solute = _H2O.copy()
         solvent = solute.copy()
 
         config = MicrosolvatorConfig(
@@ -462,7 +518,7 @@ class TestRunImplicitValidation:
 
     @pytest.mark.parametrize("method_alias", ["gfnff", "gfn-ff", "ff"])
     def test_run_prepare_only_accepts_gfnff_aliases(self, tmp_path: Path, method_alias: str):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+        solute = _H2O.copy()
         solvent = solute.copy()
 
         config = MicrosolvatorConfig(
@@ -480,23 +536,37 @@ class TestRunImplicitValidation:
         )
         assert result.executed is False
 
-    def test_run_rejects_unsupported_implicit_combo(self, tmp_path: Path):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
-        solvent = solute.copy()
+    def test_config_rejects_unsupported_implicit_combo(self):
+        with pytest.raises(ValueError, match="Unsupported implicit solvent"):
+            MicrosolvatorConfig(
+                nsolv=1,
+                method="gfnff",
+                implicit_model="gbsa",  # gfnff has no gbsa entry
+                implicit_solvent="h2o",
+            )
 
-        config = MicrosolvatorConfig(
-            nsolv=1,
-            method="gfnff",
-            implicit_model="gbsa",  # gfnff has no gbsa entry
-            implicit_solvent="h2o",
-        )
+    def test_run_rejects_combo_set_after_construction(self, tmp_path: Path, monkeypatch):
+        config = MicrosolvatorConfig(nsolv=1, method="gfnff")
+        config.implicit_model = "gbsa"  # gfnff has no gbsa entry
+        config.implicit_solvent = "h2o"
         config.crest_executable = str(_write_executable(tmp_path / "crest"))
         config.xtb_executable = str(_write_executable(tmp_path / "xtb"))
 
+        workdir = tmp_path / "run"
         with pytest.raises(ValueError, match="Unsupported implicit solvent"):
             Microsolvator.run(
-                solute=solute, solvent=solvent, config=config,
-                working_directory=tmp_path, prepare_only=True,
+                solute=_H2O.copy(), solvent=_H2O.copy(), config=config,
+                working_directory=workdir, prepare_only=True,
+            )
+        assert not workdir.exists()
+
+        def _no_mkdtemp(*args, **kwargs):
+            raise AssertionError("validation must run before a temp dir is created")
+
+        monkeypatch.setattr(runner_module.tempfile, "mkdtemp", _no_mkdtemp)
+        with pytest.raises(ValueError, match="Unsupported implicit solvent"):
+            Microsolvator.run(
+                solute=_H2O.copy(), solvent=_H2O.copy(), config=config, keep_temps=True,
             )
 
 
@@ -507,7 +577,7 @@ class TestRunImplicitValidation:
 class TestConstraints:
 
     def test_zero_index_raises(self, tmp_path: Path):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+        solute = _H2O.copy()
         solvent = solute.copy()
 
         config = MicrosolvatorConfig(nsolv=1, method="gfn2")
@@ -522,7 +592,7 @@ class TestConstraints:
             )
 
     def test_constrain_solute_writes_xcontrol(self, tmp_path: Path):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+        solute = _H2O.copy()
         solvent = solute.copy()
 
         config = MicrosolvatorConfig(nsolv=1, method="gfn2")
@@ -539,8 +609,27 @@ class TestConstraints:
         assert "1,2,3" in xcontrol
         assert "--nopreopt" in result.command
 
+    def test_large_constraint_set_sorted(self, tmp_path: Path):
+        from microsolvator.runner import (
+            _NUMPY_SORT_THRESHOLD,
+            _constraint_indices,
+            _write_constraint_file,
+        )
+
+        solute_length = _NUMPY_SORT_THRESHOLD + 100
+        indices = _constraint_indices(
+            solute_length=solute_length,
+            constrained_indices=[solute_length + 5, solute_length + 2],
+            constrain_solute=True,
+        )
+        _write_constraint_file(tmp_path, indices)
+        xcontrol = (tmp_path / ".xcontrol").read_text(encoding="utf-8")
+        atoms_line = xcontrol.splitlines()[1]
+        expected = list(range(1, solute_length + 1)) + [solute_length + 2, solute_length + 5]
+        assert atoms_line == "atoms: " + ",".join(str(i) for i in expected)
+
     def test_no_constraints_no_xcontrol(self, tmp_path: Path):
-        solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+        solute = _H2O.copy()
         solvent = solute.copy()
 
         config = MicrosolvatorConfig(nsolv=1, method="gfn2")
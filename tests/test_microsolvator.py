@@ -2,21 +2,53 @@ from pathlib import Path
 import subprocess
 import sys
 
-from ase import Atoms
+import numpy as np
+import pytest
 from ase.io import write as ase_write
 
 from microsolvator import (
     Microsolvator,
     MicrosolvatorConfig,
     list_supported_implicit_solvents,
+    read_tail,
     supports_implicit_solvent,
 )
 from microsolvator import install as install_utils
+from microsolvator import runner as runner_module
 from microsolvator.install import (
     resolve_crest_binary,
     resolve_xtb_binary,
 )
-from microsolvator.runner import _default_runner
+from microsolvator._xyz import write_xyz
+from microsolvator.command import _normalize_exec_path
+from microsolvator.runner import (
+    _default_runner,
+    _read_optional_ensemble,
+    _write_bytes_fast,
+)
+
+from helpers import (
+    _H2O,
+    _H2O_SHIFTED,
+    _POPULATION_PAYLOAD,
+    _write_executable,
+)
+
+
+_LOG_PAYLOAD = b"[OUT] crest ok\n"
+
+
+def _index_flags(command, flags):
+    """Map each of *flags* present in *command* to its index, in one pass."""
+    wanted = set(flags)
+    return {arg: index for index, arg in enumerate(command) if arg in wanted}
+
+
+@pytest.fixture(scope="module")
+def mock_execs(tmp_path_factory):
+    """Stub CREST/xTB executables shared by every test in this module."""
+    base = tmp_path_factory.mktemp("bins")
+    return _write_executable(base / "crest"), _write_executable(base / "xtb")
 
 
 def test_support_tables_consistency():
@@ -26,9 +58,9 @@ def test_support_tables_consistency():
     assert "h2o" in data["gfn2"]["alpb"]
 
 
-def test_microsolvator_run_with_constraints_and_mock_executor(tmp_path: Path):
-    solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
-    solvent = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+def test_microsolvator_run_with_constraints_and_mock_executor(tmp_path: Path, mock_execs):
+    solute = _H2O.copy()
+    solvent = _H2O.copy()
 
     config = MicrosolvatorConfig(
         nsolv=3,
@@ -37,36 +69,39 @@ def test_microsolvator_run_with_constraints_and_mock_executor(tmp_path: Path):
         implicit_solvent="h2o",
     )
 
-    crest_exec = _write_executable(tmp_path / "crest_bin")
-    xtb_exec = _write_executable(tmp_path / "xtb_bin")
-    config.crest_executable = str(crest_exec)
-    config.xtb_executable = str(xtb_exec)
+    crest_exec, xtb_exec = mock_execs
+    crest_str = str(crest_exec)
+    xtb_str = str(xtb_exec)
+    tmp_resolved = str(tmp_path.resolve())
+    config.crest_executable = crest_str
+    config.xtb_executable = xtb_str
 
     def fake_runner(command, workdir, env=None, log_path=None):
-        best = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.8, 0]])
-        ensemble = [best, best.copy()]
-        ase_write(workdir / "crest_best.xyz", best)
-        ase_write(workdir / "full_ensemble.xyz", ensemble)
+        best = _H2O_SHIFTED.copy()
+        ensemble = [best, best]
+        write_xyz(workdir / "crest_best.xyz", best)
+        write_xyz(workdir / "full_ensemble.xyz", ensemble)
         grow_dir = workdir / "grow"
         grow_dir.mkdir(exist_ok=True)
-        ase_write(grow_dir / "cluster.xyz", best)
-        ase_write(grow_dir / "qcg_grow.xyz", ensemble)
-        (workdir / "full_population.dat").write_text("1 0.5\n", encoding="utf-8")
+        write_xyz(grow_dir / "cluster.xyz", best)
+        write_xyz(grow_dir / "qcg_grow.xyz", ensemble)
+        _write_bytes_fast(workdir / "full_population.dat", _POPULATION_PAYLOAD)
         assert env is not None
-        assert env.get("CREST_BIN") == str(crest_exec)
-        assert env.get("XTB_BIN") == str(xtb_exec)
-        assert command[0] == str(crest_exec)
-        assert "--xnam" in command
-        assert command[command.index("--xnam") + 1] == str(xtb_exec)
-        assert "--enslvl" in command
-        assert command[command.index("--enslvl") + 1] == "gfn2"
-        assert "--temp" in command
-        assert command[command.index("--temp") + 1] == "298"
-        assert "--T" in command
-        assert command[command.index("--T") + 1] == "1"
-        assert command[1].startswith(str(tmp_path.resolve()))
+        assert env.get("CREST_BIN") == crest_str
+        assert env.get("XTB_BIN") == xtb_str
+        assert command[0] == crest_str
+        arg_positions = _index_flags(command, ("--xnam", "--enslvl", "--temp", "--T"))
+        assert "--xnam" in arg_positions
+        assert command[arg_positions["--xnam"] + 1] == xtb_str
+        assert "--enslvl" in arg_positions
+        assert command[arg_positions["--enslvl"] + 1] == "gfn2"
+        assert "--temp" in arg_positions
+        assert command[arg_positions["--temp"] + 1] == "298"
+        assert "--T" in arg_positions
+        assert command[arg_positions["--T"] + 1] == "1"
+        assert command[1].startswith(tmp_resolved)
         assert log_path is not None
-        Path(log_path).write_text("[OUT] crest ok\n", encoding="utf-8")
+        _write_bytes_fast(Path(log_path), _LOG_PAYLOAD)
         return subprocess.CompletedProcess(
             args=command,
             returncode=0,
@@ -96,20 +131,20 @@ def test_microsolvator_run_with_constraints_and_mock_executor(tmp_path: Path):
     assert "--T" in result.command
     assert result.final is not None
     assert len(result.traj) == 2
+    assert result.ensemble[0] is not result.ensemble[1]
     result.ensure_outputs()
 
 
-def test_prepare_only_generates_inputs_and_prints_command(tmp_path: Path, capsys):
-    solute = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
-    solvent = Atoms("H2O", positions=[[0, 0, 0], [0.9, 0, 0], [0, 0.7, 0]])
+def test_prepare_only_generates_inputs_and_prints_command(tmp_path: Path, capsys, mock_execs):
+    solute = _H2O.copy()
+    solvent = _H2O.copy()
 
     config = MicrosolvatorConfig(
         nsolv=2,
         method="gfn2",
     )
 
-    crest_exec = _write_executable(tmp_path / "crest_prepare")
-    xtb_exec = _write_executable(tmp_path / "xtb_prepare")
+    crest_exec, xtb_exec = mock_execs
     config.crest_executable = str(crest_exec)
     config.xtb_executable = str(xtb_exec)
 
@@ -140,10 +175,56 @@ def test_prepare_only_generates_inputs_and_prints_command(tmp_path: Path, capsys
     assert result.shell_command == output
 
 
-def _write_executable(path: Path) -> Path:
-    path.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
-    path.chmod(0o755)
-    return path
+def test_build_command_matches_prepare_only_without_io(tmp_path: Path, capsys, mock_execs):
+    crest_exec, xtb_exec = mock_execs
+    config = MicrosolvatorConfig(
+        nsolv=2, crest_executable=str(crest_exec), xtb_executable=str(xtb_exec)
+    )
+    workdir = tmp_path / "dry"
+
+    command = Microsolvator.build_command(
+        config=config, working_directory=workdir, solute_length=3, constrain_solute=True
+    )
+    assert not workdir.exists()
+
+    with pytest.raises(ValueError, match="solute_length"):
+        Microsolvator.build_command(
+            config=config, working_directory=workdir, constrain_solute=True
+        )
+
+    dry_run = Microsolvator.run(
+        solute=_H2O.copy(),
+        solvent=_H2O.copy(),
+        config=config,
+        constrain_solute=True,
+        working_directory=workdir,
+        prepare_only=True,
+        materialize=False,
+    )
+    assert not workdir.exists()
+    assert dry_run.shell_command == command
+
+    prepared = Microsolvator.run(
+        solute=_H2O.copy(),
+        solvent=_H2O.copy(),
+        config=config,
+        constrain_solute=True,
+        working_directory=workdir,
+        prepare_only=True,
+    )
+    capsys.readouterr()
+    assert prepared.shell_command == command
+    assert (workdir / ".xcontrol").exists()
+    assert "--nopreopt" in command
+
+    with pytest.raises(ValueError, match="working_directory"):
+        Microsolvator.run(
+            solute=_H2O.copy(),
+            solvent=_H2O.copy(),
+            config=config,
+            prepare_only=True,
+            materialize=False,
+        )
 
 
 def test_resolve_crest_explicit(tmp_path: Path):
@@ -161,6 +242,7 @@ def test_resolve_crest_package_dir(tmp_path: Path, monkeypatch):
     exe = _write_executable(tmp_path / "crest")
     monkeypatch.setattr(install_utils, "PACKAGE_BIN_DIR", tmp_path)
     assert resolve_crest_binary(None) == str(exe)
+    assert not (tmp_path / ".resolved_crest").exists()
 
 
 def test_default_runner_writes_log(tmp_path: Path):
@@ -179,3 +261,278 @@ def test_default_runner_writes_log(tmp_path: Path):
     assert "[ERR] oops" in contents
     assert "hello" in result.stdout
     assert "oops" in result.stderr
+    assert read_tail(log_path) == contents
+    assert read_tail(log_path, nbytes=8) == contents[-8:]
+
+
+def test_resolve_binary_cache_invalidated_by_install(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(install_utils, "PACKAGE_BIN_DIR", tmp_path)
+    monkeypatch.delenv("CREST_BIN", raising=False)
+    monkeypatch.setenv("PATH", "")
+
+    assert resolve_crest_binary(None) == "crest"
+    assert resolve_crest_binary(None) == "crest"
+
+    exe = _write_executable(tmp_path / "crest")
+    assert resolve_crest_binary(None) == str(exe)
+
+
+def test_resolve_explicit_binary_is_checked_every_call(tmp_path: Path):
+    target_a = _write_executable(tmp_path / "a")
+    target_b = _write_executable(tmp_path / "b")
+    link = tmp_path / "crest"
+    link.symlink_to(target_a)
+    assert resolve_crest_binary(str(link)) == str(target_a)
+
+    link.unlink()
+    link.symlink_to(target_b)
+    assert resolve_crest_binary(str(link)) == str(target_b)
+
+    link.unlink()
+    with pytest.raises(FileNotFoundError):
+        resolve_crest_binary(str(link))
+
+
+def test_normalize_exec_path_follows_path_changes(tmp_path: Path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    exe_first = _write_executable(first / "crest")
+    exe_second = _write_executable(second / "crest")
+
+    monkeypatch.setenv("PATH", str(first))
+    assert _normalize_exec_path("crest") == str(exe_first.resolve())
+    monkeypatch.setenv("PATH", str(second))
+    assert _normalize_exec_path("crest") == str(exe_second.resolve())
+
+
+def test_normalize_exec_path_follows_repointed_symlink(tmp_path: Path, monkeypatch):
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    target_a = _write_executable(tmp_path / "a")
+    target_b = _write_executable(tmp_path / "b")
+    link = bindir / "crest"
+    link.symlink_to(target_a)
+
+    monkeypatch.setenv("PATH", str(bindir))
+    assert _normalize_exec_path("crest") == str(target_a)
+    assert _normalize_exec_path(str(link)) == str(target_a)
+
+    link.unlink()
+    link.symlink_to(target_b)
+    assert _normalize_exec_path("crest") == str(target_b)
+    assert _normalize_exec_path(str(link)) == str(target_b)
+
+
+def test_find_in_package_persists_resolved_path(tmp_path: Path, monkeypatch):
+    nested = tmp_path / "crest-dist" / "bin"
+    nested.mkdir(parents=True)
+    exe = _write_executable(nested / "crest")
+    monkeypatch.setattr(install_utils, "PACKAGE_BIN_DIR", tmp_path)
+
+    assert install_utils._find_in_package("crest") == exe
+    cache_file = tmp_path / ".resolved_crest"
+    assert cache_file.read_text(encoding="utf-8").splitlines()[1] == str(exe)
+
+    def _no_walk(*args, **kwargs):
+        raise AssertionError("cached lookup should not walk the bin directory")
+
+    monkeypatch.setattr(install_utils, "_scan_for", _no_walk)
+    assert install_utils._find_in_package("crest") == exe
+
+
+def test_import_does_not_load_ase():
+    code = "import sys, microsolvator; sys.exit('ase' in sys.modules)"
+    completed = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parent.parent)
+    assert completed.returncode == 0
+
+
+def test_run_batch_returns_results_in_job_order(tmp_path: Path, mock_execs):
+    crest_exec, xtb_exec = mock_execs
+
+    def fake_runner(command, workdir):
+        nsolv = command[command.index("--nsolv") + 1]
+        best = _H2O_SHIFTED.copy()
+        ase_write(workdir / "crest_best.xyz", best)
+        return subprocess.CompletedProcess(command, 0, stdout=nsolv, stderr="")
+
+    jobs = []
+    for nsolv in (1, 2, 3):
+        config = MicrosolvatorConfig(
+            nsolv=nsolv,
+            crest_executable=str(crest_exec),
+            xtb_executable=str(xtb_exec),
+        )
+        jobs.append(
+            dict(
+                solute=_H2O.copy(),
+                solvent=_H2O.copy(),
+                config=config,
+                working_directory=tmp_path / f"job{nsolv}",
+                run_command=fake_runner,
+            )
+        )
+
+    results = Microsolvator.run_batch(jobs, max_workers=3)
+
+    assert [r.stdout for r in results] == ["1", "2", "3"]
+    assert [r.working_directory for r in results] == [tmp_path / f"job{n}" for n in (1, 2, 3)]
+
+
+def test_run_batch_cancels_pending_jobs_on_failure(tmp_path: Path, mock_execs):
+    crest_exec, xtb_exec = mock_execs
+    config = MicrosolvatorConfig(
+        nsolv=1, crest_executable=str(crest_exec), xtb_executable=str(xtb_exec)
+    )
+    started = []
+
+    def fake_runner(command, workdir):
+        started.append(workdir.name)
+        if workdir.name == "job0":
+            raise RuntimeError("crest failed")
+        ase_write(workdir / "crest_best.xyz", _H2O_SHIFTED.copy())
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    jobs = [
+        dict(
+            solute=_H2O.copy(),
+            solvent=_H2O.copy(),
+            config=config,
+            working_directory=tmp_path / f"job{index}",
+            run_command=fake_runner,
+        )
+        for index in range(5)
+    ]
+
+    with pytest.raises(RuntimeError, match="crest failed"):
+        Microsolvator.run_batch(jobs, max_workers=1)
+    assert started == ["job0"]
+
+
+def test_temporary_runs_share_arena_and_clean_up(mock_execs):
+    crest_exec, xtb_exec = mock_execs
+    config = MicrosolvatorConfig(
+        nsolv=1, crest_executable=str(crest_exec), xtb_executable=str(xtb_exec)
+    )
+    seen = []
+
+    def fake_runner(command, workdir):
+        seen.append(workdir)
+        assert (workdir / "solute.xyz").read_text(encoding="utf-8").startswith("3\n")
+        ase_write(workdir / "crest_best.xyz", _H2O_SHIFTED.copy())
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    for _ in range(2):
+        Microsolvator.run(
+            solute=_H2O.copy(),
+            solvent=_H2O.copy(),
+            config=config,
+            run_command=fake_runner,
+        )
+
+    assert seen[0] != seen[1]
+    assert seen[0].parent == seen[1].parent == Microsolvator._arena
+    assert not seen[0].exists() and not seen[1].exists()
+
+
+def test_default_runner_buffered_log(tmp_path: Path):
+    log_path = tmp_path / "crest_run.log"
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys; print('hello'); sys.stderr.write('oops\\n'); sys.exit(3)",
+    ]
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        _default_runner(cmd, tmp_path, log_path=str(log_path), stream_log=False)
+
+    assert log_path.read_text(encoding="utf-8") == "[OUT] hello\n[ERR] oops\n"
+    assert excinfo.value.stderr == "oops\n"
+
+
+def test_run_log_mode_selects_default_runner_mode(tmp_path: Path, monkeypatch, mock_execs):
+    crest_exec, xtb_exec = mock_execs
+    config = MicrosolvatorConfig(
+        nsolv=1, crest_executable=str(crest_exec), xtb_executable=str(xtb_exec)
+    )
+    seen = []
+
+    def spy_runner(command, workdir, env=None, log_path=None, **kwargs):
+        seen.append(kwargs)
+        ase_write(workdir / "crest_best.xyz", _H2O_SHIFTED.copy())
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(runner_module, "_default_runner", spy_runner)
+    for mode in ("stream", "buffered", "merged"):
+        Microsolvator.run(
+            solute=_H2O.copy(),
+            solvent=_H2O.copy(),
+            config=config,
+            working_directory=tmp_path / mode,
+            log_mode=mode,
+        )
+    assert seen == [{}, {"stream_log": False}, {"merge_streams": True}]
+
+    with pytest.raises(ValueError, match="Unknown log_mode"):
+        Microsolvator.run(solute=_H2O.copy(), solvent=_H2O.copy(), config=config, log_mode="tee")
+    with pytest.raises(ValueError, match="default runner"):
+        Microsolvator.run(
+            solute=_H2O.copy(),
+            solvent=_H2O.copy(),
+            config=config,
+            run_command=spy_runner,
+            log_mode="buffered",
+        )
+
+
+def test_default_runner_merged_streams(tmp_path: Path):
+    log_path = tmp_path / "crest_run.log"
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys; print('hello', flush=True); sys.stderr.write('oops\\n'); sys.stderr.flush(); print('bye')",
+    ]
+
+    result = _default_runner(cmd, tmp_path, log_path=str(log_path), merge_streams=True)
+
+    assert log_path.read_text(encoding="utf-8") == "[OUT] hello\n[OUT] oops\n[OUT] bye\n"
+    assert result.stdout == "hello\noops\nbye\n"
+    assert result.stderr == ""
+
+
+def test_fast_xyz_writer_matches_ase(tmp_path: Path):
+    frames = [_H2O.copy(), _H2O_SHIFTED.copy()]
+    write_xyz(tmp_path / "fast.xyz", frames)
+    ase_write(tmp_path / "ase.xyz", frames, format="xyz")
+    assert (tmp_path / "fast.xyz").read_bytes() == (tmp_path / "ase.xyz").read_bytes()
+
+
+def test_read_ensemble_shares_identical_frames_on_request(tmp_path: Path):
+    path = tmp_path / "ensemble.xyz"
+    write_xyz(path, [_H2O, _H2O_SHIFTED, _H2O])
+
+    copies = _read_optional_ensemble(path)
+    assert copies[0] is not copies[2]
+    assert np.array_equal(copies[0].positions, copies[2].positions)
+
+    frames = _read_optional_ensemble(path, share_frames=True)
+    assert frames[0] is frames[2]
+    assert frames[0] is not frames[1]
+
+
+def test_shared_frames_keep_differing_cell_and_arrays(tmp_path: Path):
+    path = tmp_path / "ensemble.extxyz"
+    small = _H2O.copy()
+    small.cell = [10.0, 10.0, 10.0]
+    large = _H2O.copy()
+    large.cell = [12.0, 12.0, 12.0]
+    charged = small.copy()
+    charged.set_initial_charges([0.1, 0.1, -0.2])
+    ase_write(path, [small, large, charged, small], format="extxyz")
+
+    frames = _read_optional_ensemble(path, share_frames=True)
+    assert len({id(frame) for frame in frames}) == 3
+    assert frames[3] is frames[0]
+    assert frames[1].cell[0][0] == 12.0
+    assert np.allclose(frames[2].get_initial_charges(), [0.1, 0.1, -0.2])